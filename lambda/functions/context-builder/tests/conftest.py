@@ -0,0 +1,12 @@
+"""Shared pytest configuration for context-builder tests."""
+
+import os
+
+# Set before the handler (and its Powertools singletons) is imported.
+# Metrics and tracing are disabled so tests skip EMF and X-Ray work; the
+# namespace keeps metrics validation happy on Powertools versions that do
+# not support POWERTOOLS_METRICS_DISABLED.
+os.environ.setdefault("POWERTOOLS_SERVICE_NAME", "context-builder")
+os.environ.setdefault("POWERTOOLS_METRICS_NAMESPACE", "CustomerServiceBot")
+os.environ.setdefault("POWERTOOLS_METRICS_DISABLED", "1")
+os.environ.setdefault("POWERTOOLS_TRACE_DISABLED", "1")
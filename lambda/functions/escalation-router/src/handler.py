@@ -1,27 +1,29 @@
 """Main handler for escalation-router Lambda function."""
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from shared.config import Config
-from shared.exceptions import LambdaError, ValidationError
+from shared.config import CONFIG
+from shared.errors import handle_error
+from shared.exceptions import ValidationError
+from shared.logger import logger, tracer
 from shared.metrics import MetricUnit, metrics
-from shared.types import LambdaResponse
 from shared.utils import format_response, get_correlation_id
 
-# Initialize
-config = Config.from_env()
-logger = Logger(service="escalation-router")
-tracer = Tracer(service="escalation-router")
+if TYPE_CHECKING:
+    # shared.types pulls in pydantic; keep it off the cold-start import path
+    from shared.types import LambdaResponse
+
+# Config, logger, tracer and metrics are shared layer singletons; the
+# service name comes from the POWERTOOLS_SERVICE_NAME env var.
+config = CONFIG
 
 
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
 @metrics.log_metrics
-def lambda_handler(event: dict[str, Any], context: LambdaContext) -> LambdaResponse:
+def lambda_handler(event: dict[str, Any], context: LambdaContext) -> "LambdaResponse":
     """
     Main Lambda handler function.
 
@@ -59,47 +61,12 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> LambdaRespo
             },
         )
 
-    except ValidationError as e:
-        logger.warning(f"Validation error: {str(e)}", exc_info=True)
-        metrics.add_metric(name="ValidationError", unit=MetricUnit.Count, value=1)
-
-        return format_response(
-            400,
-            {
-                "error": "ValidationError",
-                "message": str(e),
-                "correlation_id": correlation_id,
-            },
-        )
-
-    except LambdaError as e:
-        logger.error(f"Lambda error: {str(e)}", exc_info=True)
-        metrics.add_metric(name="LambdaError", unit=MetricUnit.Count, value=1)
-
-        return format_response(
-            500,
-            {
-                "error": type(e).__name__,
-                "message": str(e),
-                "correlation_id": correlation_id,
-            },
-        )
-
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-        metrics.add_metric(name="UnexpectedError", unit=MetricUnit.Count, value=1)
-
-        return format_response(
-            500,
-            {
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred",
-                "correlation_id": correlation_id,
-            },
-        )
+        return handle_error(e, correlation_id)
 
 
-@tracer.capture_method
+# Not traced while this is a trivial check; add @tracer.capture_method back
+# once real validation lands.
 def validate_event(event: dict[str, Any]) -> None:
     """
     Validate incoming event.
@@ -128,12 +95,13 @@ def process_event(event: dict[str, Any], context: LambdaContext) -> dict[str, An
         Processed result dictionary
     """
     # TODO: Implement your business logic here
-    logger.debug(f"Processing event: {json.dumps(event)}")
+    # Serialized only if the record is emitted
+    logger.debug("Processing event", extra={"event": event})
+
+    get_remaining_time = getattr(context, "get_remaining_time_in_millis", None)
 
     return {
         "function": "escalation-router",
-        "request_id": context.aws_request_id if hasattr(context, "aws_request_id") else None,
-        "remaining_time_ms": context.get_remaining_time_in_millis()
-        if hasattr(context, "get_remaining_time_in_millis")
-        else None,
+        "request_id": getattr(context, "aws_request_id", None),
+        "remaining_time_ms": get_remaining_time() if get_remaining_time else None,
     }
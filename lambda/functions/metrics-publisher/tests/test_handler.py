@@ -5,11 +5,15 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from shared.exceptions import ValidationError
+import shared.logger
+import shared.metrics
+import shared.tracing
+from shared.exceptions import BedrockError, ValidationError
+from src import handler
 from src.handler import lambda_handler, process_event, validate_event
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lambda_context() -> Mock:
     """Create mock Lambda context."""
     context = Mock()
@@ -26,7 +30,7 @@ def lambda_context() -> Mock:
     return context
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_event() -> dict:
     """Create sample Lambda event."""
     return {
@@ -60,6 +64,16 @@ class TestLambdaHandler:
         body = json.loads(response["body"])
         assert body["error"] == "ValidationError"
 
+    def test_lambda_handler_lambda_error(self, sample_event: dict, lambda_context: Mock) -> None:
+        """Test lambda handler with a LambdaError subclass."""
+        with patch("src.handler.process_event", side_effect=BedrockError("Model unavailable")):
+            response = lambda_handler(sample_event, lambda_context)
+
+            assert response["statusCode"] == 500
+            body = json.loads(response["body"])
+            assert body["error"] == "BedrockError"
+            assert body["message"] == "Model unavailable"
+
     def test_lambda_handler_unexpected_error(
         self, sample_event: dict, lambda_context: Mock
     ) -> None:
@@ -96,3 +110,13 @@ class TestProcessEvent:
         assert "function" in result
         assert result["function"] == "metrics-publisher"
         assert "request_id" in result
+
+
+class TestPowertoolsSingletons:
+    """Test cases for shared Powertools instances."""
+
+    def test_handler_uses_shared_instances(self) -> None:
+        """Test handler reuses the shared layer logger, tracer and metrics."""
+        assert handler.metrics is shared.metrics.metrics is shared.logger.metrics
+        assert handler.tracer is shared.tracing.tracer is shared.logger.tracer
+        assert handler.logger is shared.logger.logger
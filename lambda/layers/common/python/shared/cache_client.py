@@ -1,8 +1,9 @@
 """Redis cache client for session caching and rate limiting."""
 
-import json
 import os
-from typing import Any, Optional
+import time
+from functools import cache
+from typing import Any
 
 try:
     import redis
@@ -11,53 +12,215 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    from cachetools import LRUCache, TTLCache
+
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
 from aws_lambda_powertools import Logger
 
+from shared.utils import json_dumps, json_loads
+
 logger = Logger()
 
+# Cache value encoding: "msgpack" (default) or "json"
+CACHE_CODEC = os.environ.get("CACHE_CODEC", "msgpack").lower()
+_USE_MSGPACK = CACHE_CODEC == "msgpack" and MSGPACK_AVAILABLE
+
+# In-process cache in front of Redis, per warm container. Entries hold the
+# serialized payload so every hit returns a fresh object.
+LOCAL_CACHE_MAXSIZE = int(os.environ.get("LOCAL_CACHE_MAXSIZE", "1024"))
+LOCAL_CACHE_TTL = int(os.environ.get("LOCAL_CACHE_TTL", "60"))
+_local_cache: Any = (
+    TTLCache(maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL)
+    if CACHETOOLS_AVAILABLE and LOCAL_CACHE_MAXSIZE > 0 and LOCAL_CACHE_TTL > 0
+    else None
+)
+# Keys set with local_ttl=0, mapped to when their Redis value expires, so
+# that get() does not pull them back into the local cache
+_local_opt_outs: Any = LRUCache(maxsize=LOCAL_CACHE_MAXSIZE) if _local_cache is not None else None
+
+
+# msgpack payloads carry this leading byte; JSON text and INCR counters never
+# start with it, so untagged values are always decoded as JSON
+_MSGPACK_TAG = b"\x01"
+
+
+class _MsgpackUnsupported(Exception):
+    """Raised from the msgpack default hook for values msgpack cannot hold exactly."""
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, int):
+        # Outside the 64-bit range; JSON keeps it exact
+        raise _MsgpackUnsupported
+    return str(obj)
+
+
+def _serialize(value: Any) -> bytes | str:
+    """Encode a value for storage in Redis."""
+    if _USE_MSGPACK:
+        try:
+            packed: bytes = msgpack.packb(value, use_bin_type=True, default=_msgpack_default)
+            return _MSGPACK_TAG + packed
+        except (_MsgpackUnsupported, UnicodeEncodeError):
+            pass
+    return json_dumps(value, default=str)
+
+
+def _deserialize(value: bytes | str) -> Any:
+    """Decode a value read from Redis."""
+    if isinstance(value, bytes) and value[:1] == _MSGPACK_TAG:
+        return msgpack.unpackb(value[1:], raw=False, strict_map_key=False)
+    return json_loads(value)
+
+
+def _local_get(key: str) -> bytes | str | None:
+    """Return the serialized payload for key from the local cache, if fresh."""
+    if _local_cache is None:
+        return None
+
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, payload = entry
+    if expires_at <= time.monotonic():
+        _local_cache.pop(key, None)
+        return None
+    payload_value: bytes | str = payload
+    return payload_value
+
+
+def _local_set(key: str, payload: bytes | str, ttl: float) -> None:
+    """Store a serialized payload in the local cache for up to ttl seconds."""
+    if _local_cache is not None and ttl > 0:
+        _local_cache[key] = (time.monotonic() + ttl, payload)
+
+
+def _skip_local(key: str) -> bool:
+    """Return True if get() should not cache key locally (tier disabled or opted out)."""
+    if _local_opt_outs is None:
+        return True
+
+    expires_at = _local_opt_outs.get(key)
+    if expires_at is None:
+        return False
+    if expires_at <= time.monotonic():
+        _local_opt_outs.pop(key, None)
+        return False
+    return True
+
+
+def _local_ttl_from_pttl(pttl: int) -> float:
+    """Cap LOCAL_CACHE_TTL by a key's remaining Redis TTL in milliseconds."""
+    if pttl < 0:  # -1: no expiry
+        return LOCAL_CACHE_TTL
+    return min(LOCAL_CACHE_TTL, pttl / 1000)
+
+
+def _local_forget(key: str) -> None:
+    """Drop key from the local cache and the opt-out list."""
+    if _local_cache is not None:
+        _local_cache.pop(key, None)
+        _local_opt_outs.pop(key, None)
+
+
+# Seconds between reconnect attempts after a failed Redis connection
+REDIS_RECONNECT_INTERVAL = int(os.environ.get("REDIS_RECONNECT_INTERVAL", "30"))
+
+# INCRBY and set the TTL if the counter has none, atomically in one round-trip.
+# Works on any Redis version, unlike EXPIRE NX (Redis 7+).
+_INCREMENT_WITH_TTL_SCRIPT = """
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if redis.call('TTL', KEYS[1]) == -1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return value
+"""
+
+
+@cache
+def get_redis() -> Any:
+    """
+    Create the Redis client once per warm container.
+
+    Returns:
+        Connected Redis client, or None if Redis is unavailable
+    """
+    if not REDIS_AVAILABLE:
+        logger.warning("Redis library not available, caching disabled")
+        return None
+
+    try:
+        client = redis.Redis(
+            host=os.environ.get("REDIS_ENDPOINT", ""),
+            port=int(os.environ.get("REDIS_PORT", "6379")),
+            password=os.environ.get("REDIS_AUTH_TOKEN", ""),
+            ssl=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            retry_on_timeout=True,
+            health_check_interval=30,
+        )
+        # Test connection
+        client.ping()
+        logger.info("Redis connection established")
+        return client
+    except Exception:
+        logger.exception("Failed to connect to Redis")
+        return None
+
 
 class RedisCache:
     """Redis cache client with connection pooling."""
 
-    _instance: Optional["RedisCache"] = None
-    _redis_client: Any = None
+    def __init__(self) -> None:
+        self._client: Any = None
+        self._increment_script: Any = None
+        self._next_connect_attempt = 0.0
 
-    def __new__(cls) -> "RedisCache":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        # Connect eagerly so the first request does not pay for it
+        _ = self._redis_client
 
-    def __init__(self) -> None:
-        if not REDIS_AVAILABLE:
-            logger.warning("Redis library not available, caching disabled")
-            return
+    @property
+    def _redis_client(self) -> Any:
+        """
+        Return the shared Redis client, connecting while it is still missing.
 
-        if self._redis_client is None:
-            self._connect()
+        A failed connection is retried at most every REDIS_RECONNECT_INTERVAL
+        seconds, so long-lived instances recover once Redis is reachable
+        without every call waiting on a connect timeout.
 
-    def _connect(self) -> None:
-        """Establish Redis connection."""
-        if not REDIS_AVAILABLE:
-            return
+        Returns:
+            Redis client, or None if Redis is unavailable
+        """
+        if self._client is not None:
+            return self._client
 
-        try:
-            self._redis_client = redis.Redis(
-                host=os.environ.get("REDIS_ENDPOINT", ""),
-                port=int(os.environ.get("REDIS_PORT", "6379")),
-                password=os.environ.get("REDIS_AUTH_TOKEN", ""),
-                ssl=True,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True,
-                health_check_interval=30,
-            )
-            # Test connection
-            self._redis_client.ping()
-            logger.info("Redis connection established")
-        except Exception:
-            logger.exception("Failed to connect to Redis")
-            self._redis_client = None
+        if time.monotonic() < self._next_connect_attempt:
+            return None
+
+        self._client = get_redis()
+        if self._client is None:
+            if REDIS_AVAILABLE:
+                # Do not keep the failed attempt for the lifetime of the container
+                get_redis.cache_clear()
+                self._next_connect_attempt = time.monotonic() + REDIS_RECONNECT_INTERVAL
+            return None
+
+        # Script objects run via EVALSHA and reload the script on NOSCRIPT
+        self._increment_script = self._client.register_script(_INCREMENT_WITH_TTL_SCRIPT)
+        return self._client
 
     def get(self, key: str) -> Any | None:
         """
@@ -69,19 +232,41 @@ class RedisCache:
         Returns:
             Cached value or None
         """
-        if not self._redis_client:
+        local_value = _local_get(key)
+        if local_value is not None:
+            try:
+                return _deserialize(local_value)
+            except Exception as e:
+                # Drop the bad entry and fall back to Redis
+                logger.error(f"Local cache decode error: {str(e)}")
+                _local_forget(key)
+
+        client = self._redis_client
+        if not client:
             return None
 
         try:
-            value = self._redis_client.get(key)
-            if value:
-                return json.loads(value)
-            return None
+            if _skip_local(key):
+                value = client.get(key)
+                return _deserialize(value) if value else None
+
+            # Fetch the remaining TTL with the value so the local copy never
+            # outlives the Redis key
+            pipe = client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            value, pttl = pipe.execute()
+            if not value:
+                return None
+            # Decode before caching so an unreadable payload is never kept locally
+            decoded = _deserialize(value)
+            _local_set(key, value, _local_ttl_from_pttl(pttl))
+            return decoded
         except Exception as e:
             logger.error(f"Redis GET error: {str(e)}")
             return None
 
-    def set(self, key: str, value: Any, ttl: int = 300) -> bool:
+    def set(self, key: str, value: Any, ttl: int = 300, local_ttl: int | None = None) -> bool:
         """
         Set value in cache with TTL.
 
@@ -89,16 +274,28 @@ class RedisCache:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds
+            local_ttl: Time to live in the in-process cache, capped at ttl and
+                LOCAL_CACHE_TTL (defaults to LOCAL_CACHE_TTL; 0 skips it). The
+                opt-out only applies in the container that wrote the key; other
+                containers may still cache it locally for up to LOCAL_CACHE_TTL.
 
         Returns:
             True if successful, False otherwise
         """
-        if not self._redis_client:
+        client = self._redis_client
+        if not client:
             return False
 
         try:
-            serialized = json.dumps(value, default=str)
-            self._redis_client.setex(key, ttl, serialized)
+            serialized = _serialize(value)
+            client.setex(key, ttl, serialized)
+
+            _local_forget(key)
+            effective_local_ttl = min(ttl, LOCAL_CACHE_TTL if local_ttl is None else local_ttl)
+            if effective_local_ttl > 0:
+                _local_set(key, serialized, effective_local_ttl)
+            elif _local_opt_outs is not None:
+                _local_opt_outs[key] = time.monotonic() + ttl
             return True
         except Exception as e:
             logger.error(f"Redis SET error: {str(e)}")
@@ -114,11 +311,14 @@ class RedisCache:
         Returns:
             True if successful, False otherwise
         """
-        if not self._redis_client:
+        _local_forget(key)
+
+        client = self._redis_client
+        if not client:
             return False
 
         try:
-            self._redis_client.delete(key)
+            client.delete(key)
             return True
         except Exception as e:
             logger.error(f"Redis DELETE error: {str(e)}")
@@ -136,14 +336,17 @@ class RedisCache:
         Returns:
             New counter value or None on error
         """
-        if not self._redis_client:
+        client = self._redis_client
+        if not client:
             return None
 
         try:
-            value = self._redis_client.incr(key, amount)
-            if ttl and value == amount:  # First increment, set TTL
-                self._redis_client.expire(key, ttl)
-            return value
+            if not ttl:
+                value: int = client.incr(key, amount)
+                return value
+
+            value = self._increment_script(keys=[key], args=[amount, ttl])
+            return int(value)
         except Exception as e:
             logger.error(f"Redis INCR error: {str(e)}")
             return None
@@ -1,7 +1,7 @@
 """Configuration management."""
 
 import os
-from functools import lru_cache
+from functools import cached_property
 from typing import Any
 
 
@@ -10,45 +10,63 @@ class Config:
 
     def __init__(self) -> None:
         """Initialize configuration from environment."""
-        self.environment = os.getenv("ENVIRONMENT", "dev")
-        self.log_level = os.getenv("LOG_LEVEL", "INFO")
-        self.region = os.getenv("AWS_REGION", "us-east-1")
-        self.json_logging = os.getenv("JSON_LOGGING", "true").lower() == "true"
+        env = os.environ
+        self._env = env
+
+        self.environment = env.get("ENVIRONMENT", "dev")
+        self.log_level = env.get("LOG_LEVEL", "INFO")
+        self.region = env.get("AWS_REGION", "us-east-1")
+        self.json_logging = env.get("JSON_LOGGING", "true").lower() == "true"
 
         # Powertools configuration
-        self.service_name = os.getenv("POWERTOOLS_SERVICE_NAME", "customer-service-bot")
+        self.service_name = env.get("POWERTOOLS_SERVICE_NAME", "customer-service-bot")
 
         # Bedrock configuration
-        self.bedrock_model_id = os.getenv(
+        self.bedrock_model_id = env.get(
             "BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20241022-v2:0"
         )
-        self.bedrock_max_tokens = int(os.getenv("BEDROCK_MAX_TOKENS", "1000"))
-        self.bedrock_temperature = float(os.getenv("BEDROCK_TEMPERATURE", "0.7"))
 
         # DynamoDB configuration
-        self.dynamodb_table = os.getenv("DYNAMODB_TABLE", "")
+        self.dynamodb_table = env.get("DYNAMODB_TABLE", "")
 
         # SQS configuration
-        self.escalation_queue_url = os.getenv("ESCALATION_QUEUE_URL", "")
+        self.escalation_queue_url = env.get("ESCALATION_QUEUE_URL", "")
 
         # CloudWatch metrics
-        self.metrics_namespace = os.getenv("METRICS_NAMESPACE", "CustomerServiceBot")
+        self.metrics_namespace = env.get("METRICS_NAMESPACE", "CustomerServiceBot")
 
         # Redis configuration
-        self.redis_endpoint = os.getenv("REDIS_ENDPOINT", "")
-        self.redis_port = int(os.getenv("REDIS_PORT", "6379"))
-        self.redis_auth_token = os.getenv("REDIS_AUTH_TOKEN", "")
+        self.redis_endpoint = env.get("REDIS_ENDPOINT", "")
+        self.redis_auth_token = env.get("REDIS_AUTH_TOKEN", "")
+
+    # Numeric settings are parsed on first access, as not every function uses them
+
+    @cached_property
+    def bedrock_max_tokens(self) -> int:
+        """Maximum tokens for Bedrock responses."""
+        return int(self._env.get("BEDROCK_MAX_TOKENS", "1000"))
+
+    @cached_property
+    def bedrock_temperature(self) -> float:
+        """Sampling temperature for Bedrock requests."""
+        return float(self._env.get("BEDROCK_TEMPERATURE", "0.7"))
+
+    @cached_property
+    def redis_port(self) -> int:
+        """Redis port."""
+        return int(self._env.get("REDIS_PORT", "6379"))
 
     @classmethod
-    @lru_cache(maxsize=1)
     def from_env(cls) -> "Config":
         """
-        Create configuration from environment variables.
+        Return the configuration loaded from environment variables.
+
+        Kept for compatibility; prefer importing CONFIG directly.
 
         Returns:
-            Cached configuration instance
+            Module-level configuration instance
         """
-        return cls()
+        return CONFIG
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -64,3 +82,7 @@ class Config:
             "json_logging": self.json_logging,
             "service_name": self.service_name,
         }
+
+
+# Loaded once at import so misconfiguration surfaces during cold start
+CONFIG: Config = Config()
@@ -0,0 +1,82 @@
+"""Error response handling for Lambda handlers."""
+
+from collections.abc import Callable
+from typing import Any
+
+from shared.exceptions import LambdaError, ValidationError
+from shared.logger import logger
+from shared.metrics import MetricUnit, metrics
+from shared.utils import format_error_response
+
+# Error handling by exception type, matched along the exception MRO:
+# (status code, error name, log method, log label, metric name).
+# An error name of None reports the exception class name.
+_ErrorSpec = tuple[int, str | None, Callable[..., None], str, str]
+
+_ERROR_MAP: dict[type[BaseException], _ErrorSpec] = {
+    ValidationError: (
+        400,
+        "ValidationError",
+        logger.warning,
+        "Validation error",
+        "ValidationError",
+    ),
+    LambdaError: (500, None, logger.error, "Lambda error", "LambdaError"),
+}
+_UNEXPECTED_ERROR: _ErrorSpec = (
+    500,
+    "InternalServerError",
+    logger.error,
+    "Unexpected error",
+    "UnexpectedError",
+)
+
+# _ERROR_MAP resolution per concrete exception type, filled on first use
+_RESOLVED_ERRORS: dict[type[BaseException], _ErrorSpec] = {}
+
+
+def handle_error(e: Exception, correlation_id: str) -> dict[str, Any]:
+    """
+    Log, record and format the response for a failed invocation.
+
+    Kept out of the handlers so their success path stays small.
+
+    Args:
+        e: Exception raised while handling the event
+        correlation_id: Correlation ID of the request
+
+    Returns:
+        Error response dictionary
+    """
+    spec = classify_error(e)
+    status_code, error, log, log_label, metric_name = spec
+    message = "An unexpected error occurred" if spec is _UNEXPECTED_ERROR else str(e)
+
+    log(f"{log_label}: {str(e)}", exc_info=True)
+    metrics.add_metric(name=metric_name, unit=MetricUnit.Count, value=1)
+
+    return format_error_response(status_code, error or type(e).__name__, message, correlation_id)
+
+
+def classify_error(e: Exception) -> _ErrorSpec:
+    """
+    Resolve the error handling for an exception.
+
+    The MRO walk runs once per exception type; later lookups are a single
+    dict hit.
+
+    Args:
+        e: Exception to classify
+
+    Returns:
+        Matching _ERROR_MAP entry, or _UNEXPECTED_ERROR
+    """
+    exc_type = type(e)
+    spec = _RESOLVED_ERRORS.get(exc_type)
+    if spec is None:
+        spec = next(
+            (_ERROR_MAP[cls] for cls in exc_type.__mro__ if cls in _ERROR_MAP),
+            _UNEXPECTED_ERROR,
+        )
+        _RESOLVED_ERRORS[exc_type] = spec
+    return spec
@@ -1,10 +1,15 @@
 """Logging configuration using AWS Lambda Powertools."""
 
+from functools import partial
+
 from aws_lambda_powertools import Logger, Metrics, Tracer
 
+from shared.utils import json_dumps
+
 # Initialize Powertools resources
 # Service name will be automatically captured from POWERTOOLS_SERVICE_NAME env var
-logger = Logger(utc=True)
+# json_dumps uses orjson, falling back to stdlib json for records orjson rejects
+logger = Logger(utc=True, json_serializer=partial(json_dumps, default=str))
 tracer = Tracer()
 metrics = Metrics()
 
@@ -1,8 +1,7 @@
 """CloudWatch embedded metrics configuration."""
 
-from aws_lambda_powertools import Metrics
 from aws_lambda_powertools.metrics import MetricUnit
 
-metrics = Metrics()
+from shared.logger import metrics
 
 __all__ = ["metrics", "MetricUnit"]
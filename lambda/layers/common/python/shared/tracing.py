@@ -1,5 +1,5 @@
 """X-Ray tracing configuration."""
 
-from aws_lambda_powertools import Tracer
+from shared.logger import tracer
 
-tracer = Tracer()
+__all__ = ["tracer"]
@@ -1,6 +1,6 @@
 """Common type definitions using Pydantic."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
@@ -9,6 +9,11 @@ from pydantic import BaseModel, Field
 LambdaResponse = dict[str, Any]
 
 
+def _utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
 class ConversationContext(BaseModel):
     """Context maintained across conversation turns."""
 
@@ -18,8 +23,8 @@ class ConversationContext(BaseModel):
     session_id: str
     message_history: list[dict[str, Any]] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 
 class IntentClassification(BaseModel):
@@ -50,5 +55,5 @@ class EscalationTicket(BaseModel):
     context: dict[str, Any]
     customer_tier: str = "standard"
     sentiment: dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     priority: str = "medium"
@@ -1,9 +1,93 @@
 """Utility functions."""
 
 import json
-from datetime import datetime
+import re
+import time
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson encode errors for input the stdlib json module accepts
+_ORJSON_STDLIB_ONLY_ERRORS = ("Integer exceeds 64-bit range", "str is not valid UTF-8")
+# Digit runs long enough to hold an integer outside the 64-bit range, which
+# orjson parses as a float; the stdlib json module keeps them exact
+_LONG_DIGIT_RUN = re.compile(r"[0-9]{19,}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"[0-9]{19,}")
+
+# Headers shared by every API Gateway response
+_BASE_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+_EMPTY_HEADERS: MappingProxyType[str, str] = MappingProxyType({})
+
+
+def _iso_now() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string.
+
+    Formats from time.time_ns() directly instead of building a datetime.
+
+    Returns:
+        Timestamp such as 2024-01-01T12:00:00.123456
+    """
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanoseconds // 1000:06d}"
+
+
+def json_dumps(obj: Any, default: Any = None) -> str:
+    """
+    Serialize object to a JSON string, using orjson when available.
+
+    Falls back to the stdlib json module for input orjson rejects but json
+    accepts: integers beyond 64 bits and strings with lone surrogates.
+
+    Args:
+        obj: Object to serialize
+        default: Optional callable for objects that are not natively serializable
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError as e:
+            if not str(e).startswith(_ORJSON_STDLIB_ONLY_ERRORS):
+                raise
+    return json.dumps(obj, default=default)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Deserialize JSON string or bytes, using orjson when available.
+
+    Documents with integers that may exceed 64 bits are parsed with the
+    stdlib json module so they stay exact ints.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Deserialized object
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        if isinstance(data, bytes):
+            has_long_digits = _LONG_DIGIT_RUN_BYTES.search(data) is not None
+        else:
+            has_long_digits = _LONG_DIGIT_RUN.search(data) is not None
+        if not has_long_digits:
+            return orjson.loads(data)
+    return json.loads(data)
+
 
 def parse_json_body(body: str | None) -> dict[str, Any]:
     """
@@ -22,16 +106,33 @@ def parse_json_body(body: str | None) -> dict[str, Any]:
         return {}
 
     try:
-        result: dict[str, Any] = json.loads(body)
+        result: dict[str, Any] = json_loads(body)
         return result
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise ValueError(f"Invalid JSON in request body: {e}") from e
 
 
+def _response_headers(
+    headers: dict[str, str] | None,
+    include_timestamp: bool,
+    timestamp: str | None,
+) -> dict[str, str]:
+    """Build the headers for format_response and format_error_response."""
+    if include_timestamp:
+        return {
+            **_BASE_HEADERS,
+            "X-Timestamp": timestamp or _iso_now(),
+            **(headers or {}),
+        }
+    return {**_BASE_HEADERS, **(headers or {})}
+
+
 def format_response(
     status_code: int,
     body: dict[str, Any],
     headers: dict[str, str] | None = None,
+    include_timestamp: bool = True,
+    timestamp: str | None = None,
 ) -> dict[str, Any]:
     """
     Format Lambda response for API Gateway.
@@ -40,22 +141,61 @@ def format_response(
         status_code: HTTP status code
         body: Response body as dictionary
         headers: Optional HTTP headers
+        include_timestamp: Whether to add the X-Timestamp header
+        timestamp: Precomputed X-Timestamp value, so responses built in one
+            invocation can share it (defaults to the current UTC time)
 
     Returns:
         Formatted response dictionary
     """
-    default_headers = {
-        "Content-Type": "application/json",
-        "X-Timestamp": datetime.utcnow().isoformat(),
+    return {
+        "statusCode": status_code,
+        "headers": _response_headers(headers, include_timestamp, timestamp),
+        "body": json_dumps(body),
     }
 
-    if headers:
-        default_headers.update(headers)
 
+@cache
+def _error_body_prefix(error: str) -> str:
+    """Return the serialized body prefix up to the message value for an error name."""
+    return f'{{"error":{json_dumps(error)},"message":'
+
+
+def format_error_response(
+    status_code: int,
+    error: str,
+    message: str,
+    correlation_id: str,
+    headers: dict[str, str] | None = None,
+    include_timestamp: bool = True,
+    timestamp: str | None = None,
+) -> dict[str, Any]:
+    """
+    Format an error response for API Gateway.
+
+    Equivalent to format_response with an error/message/correlation_id body,
+    but the constant part of the body is serialized once per error name.
+
+    Args:
+        status_code: HTTP status code
+        error: Error name
+        message: Error message
+        correlation_id: Correlation ID of the request
+        headers: Optional HTTP headers
+        include_timestamp: Whether to add the X-Timestamp header
+        timestamp: Precomputed X-Timestamp value
+
+    Returns:
+        Formatted response dictionary
+    """
+    body = (
+        f"{_error_body_prefix(error)}{json_dumps(message)}"
+        f',"correlation_id":{json_dumps(correlation_id)}}}'
+    )
     return {
         "statusCode": status_code,
-        "headers": default_headers,
-        "body": json.dumps(body),
+        "headers": _response_headers(headers, include_timestamp, timestamp),
+        "body": body,
     }
 
 
@@ -70,11 +210,13 @@ def get_correlation_id(event: dict[str, Any]) -> str:
         Correlation ID string
     """
     # Try API Gateway request ID
-    if "requestContext" in event:
-        request_id: str = event["requestContext"].get("requestId", "")
-        return request_id
-
-    # Try headers
-    headers = event.get("headers", {})
-    correlation_id: str = headers.get("x-correlation-id", headers.get("x-request-id", ""))
+    request_context = event.get("requestContext")
+    if request_context is not None:
+        request_id: str = request_context.get("requestId")
+        if request_id:
+            return request_id
+
+    # Try headers (API Gateway sends null when there are none)
+    headers = event.get("headers") or _EMPTY_HEADERS
+    correlation_id: str = headers.get("x-correlation-id") or headers.get("x-request-id") or ""
     return correlation_id
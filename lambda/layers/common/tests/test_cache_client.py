@@ -0,0 +1,252 @@
+"""Unit tests for shared.cache_client."""
+
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared import cache_client
+from shared.cache_client import RateLimiter, RedisCache
+
+
+@pytest.fixture
+def redis_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Patch get_redis to return a mock Redis client."""
+    client = MagicMock()
+    monkeypatch.setattr(cache_client, "get_redis", lambda: client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache() -> Iterator[None]:
+    """Start and end every test with an empty in-process cache."""
+    cache_client._local_cache.clear()
+    cache_client._local_opt_outs.clear()
+    yield
+    cache_client._local_cache.clear()
+    cache_client._local_opt_outs.clear()
+
+
+def _redis_returns(client: MagicMock, value: object, pttl: int) -> None:
+    """Make the GET + PTTL pipeline return a serialized value and remaining TTL."""
+    payload = None if value is None else cache_client._serialize(value)
+    client.pipeline.return_value.execute.return_value = [payload, pttl]
+    client.get.return_value = payload
+
+
+class TestCodec:
+    """Test cases for the Redis payload codec."""
+
+    def _round_trip(self, redis_client: MagicMock, value: object) -> object:
+        """Write value through set and read it back from Redis."""
+        RedisCache().set("key", value, local_ttl=0)
+        payload = redis_client.setex.call_args.args[2]
+        redis_client.get.return_value = payload
+        return RedisCache().get("key")
+
+    def test_int_keys(self, redis_client: MagicMock) -> None:
+        """Test dicts with int keys can be read back."""
+        assert self._round_trip(redis_client, {1: "a"}) == {1: "a"}
+
+    def test_big_int(self, redis_client: MagicMock) -> None:
+        """Test ints beyond 64 bits come back as ints."""
+        assert self._round_trip(redis_client, {"n": 2**70}) == {"n": 2**70}
+
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [(b"7", 7), (b"123", 123), (b'{"a": 1}', {"a": 1}), (b'"x"', "x")],
+    )
+    def test_untagged_payloads_read_as_json(
+        self, redis_client: MagicMock, payload: bytes, expected: object
+    ) -> None:
+        """Test pre-msgpack JSON values and INCR counters are not decoded as msgpack."""
+        redis_client.pipeline.return_value.execute.return_value = [payload, -1]
+
+        assert RedisCache().get("key") == expected
+
+
+class TestTwoTierCache:
+    """Test cases for the in-process cache in front of Redis."""
+
+    def test_set_then_get_hits_local(self, redis_client: MagicMock) -> None:
+        """Test values written through set are served without Redis."""
+        cache = RedisCache()
+        cache.set("key", {"a": 1})
+
+        assert cache.get("key") == {"a": 1}
+        redis_client.pipeline.assert_not_called()
+        redis_client.get.assert_not_called()
+
+    def test_local_hit_returns_fresh_object(self, redis_client: MagicMock) -> None:
+        """Test mutating a returned value does not change the cached one."""
+        cache = RedisCache()
+        cache.set("key", {"a": 1})
+
+        cache.get("key")["a"] = 2
+
+        assert cache.get("key") == {"a": 1}
+
+    def test_miss_reads_redis_and_populates_local(self, redis_client: MagicMock) -> None:
+        """Test a local miss reads Redis once and caches the value locally."""
+        _redis_returns(redis_client, {"a": 1}, pttl=-1)
+        cache = RedisCache()
+
+        assert cache.get("key") == {"a": 1}
+        assert cache.get("key") == {"a": 1}
+        redis_client.pipeline.return_value.execute.assert_called_once()
+
+    def test_missing_key(self, redis_client: MagicMock) -> None:
+        """Test keys missing from Redis return None and are not cached."""
+        _redis_returns(redis_client, None, pttl=-2)
+
+        assert RedisCache().get("key") is None
+        assert "key" not in cache_client._local_cache
+
+    def test_bad_local_entry_falls_back_to_redis(self, redis_client: MagicMock) -> None:
+        """Test an undecodable local entry is dropped and the value read from Redis."""
+        cache_client._local_set("key", b"\x01\xc1", 60)
+        _redis_returns(redis_client, {"a": 1}, pttl=-1)
+
+        assert RedisCache().get("key") == {"a": 1}
+        assert cache_client._deserialize(cache_client._local_get("key")) == {"a": 1}
+
+    def test_bad_redis_payload_not_cached(self, redis_client: MagicMock) -> None:
+        """Test an undecodable Redis value returns None and is not cached locally."""
+        redis_client.pipeline.return_value.execute.return_value = [b"\x01\xc1", -1]
+
+        assert RedisCache().get("key") is None
+        assert "key" not in cache_client._local_cache
+
+    def test_local_ttl_capped_by_redis_ttl(
+        self, redis_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a Redis hit is not cached locally beyond the key's Redis TTL."""
+        _redis_returns(redis_client, "value", pttl=2000)
+        cache = RedisCache()
+        now = time.monotonic()
+        monkeypatch.setattr(cache_client.time, "monotonic", lambda: now)
+
+        cache.get("key")
+        assert cache_client._local_cache["key"][0] == pytest.approx(now + 2)
+
+        # After the Redis TTL the local copy is stale and Redis is asked again
+        _redis_returns(redis_client, None, pttl=-2)
+        monkeypatch.setattr(cache_client.time, "monotonic", lambda: now + 3)
+
+        assert cache.get("key") is None
+
+    def test_set_local_ttl_capped_by_ttl(self, redis_client: MagicMock) -> None:
+        """Test set never caches locally for longer than the Redis TTL."""
+        RedisCache().set("key", "value", ttl=2)
+
+        expires_at = cache_client._local_cache["key"][0]
+        assert expires_at - time.monotonic() <= 2
+
+    def test_local_ttl_opt_out(self, redis_client: MagicMock) -> None:
+        """Test local_ttl=0 keeps the key out of the local cache, even after a get."""
+        cache = RedisCache()
+        cache.set("key", "value", local_ttl=0)
+        _redis_returns(redis_client, "value", pttl=300000)
+
+        assert cache.get("key") == "value"
+        assert cache.get("key") == "value"
+
+        assert "key" not in cache_client._local_cache
+        assert redis_client.get.call_count == 2
+        redis_client.pipeline.assert_not_called()
+
+    def test_set_clears_opt_out(self, redis_client: MagicMock) -> None:
+        """Test a later set without local_ttl=0 caches the key locally again."""
+        cache = RedisCache()
+        cache.set("key", "old", local_ttl=0)
+        cache.set("key", "new")
+
+        assert cache.get("key") == "new"
+        redis_client.get.assert_not_called()
+
+    def test_delete_clears_both_tiers(self, redis_client: MagicMock) -> None:
+        """Test delete removes the key locally and from Redis."""
+        cache = RedisCache()
+        cache.set("key", "value")
+
+        assert cache.delete("key") is True
+
+        assert "key" not in cache_client._local_cache
+        redis_client.delete.assert_called_once_with("key")
+
+
+class TestConnection:
+    """Test cases for RedisCache connection handling."""
+
+    def test_instance_reconnects_after_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an instance created while Redis is down recovers later."""
+        client = MagicMock()
+        get_redis = MagicMock(side_effect=[None, client])
+        monkeypatch.setattr(cache_client, "get_redis", get_redis)
+        monkeypatch.setattr(cache_client, "REDIS_AVAILABLE", True)
+        monkeypatch.setattr(cache_client, "REDIS_RECONNECT_INTERVAL", 0)
+        cache = RedisCache()
+        client.incr.return_value = 1
+
+        assert cache.increment("counter") == 1
+        assert get_redis.call_count == 2
+        get_redis.cache_clear.assert_called_once()
+
+    def test_reconnect_waits_for_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test failed connections are not retried on every call."""
+        get_redis = MagicMock(return_value=None)
+        monkeypatch.setattr(cache_client, "get_redis", get_redis)
+        monkeypatch.setattr(cache_client, "REDIS_AVAILABLE", True)
+        monkeypatch.setattr(cache_client, "REDIS_RECONNECT_INTERVAL", 60)
+        cache = RedisCache()
+
+        assert cache.get("key") is None
+        assert cache.increment("counter") is None
+        get_redis.assert_called_once()
+
+
+class TestIncrement:
+    """Test cases for RedisCache.increment."""
+
+    def test_increment_registers_script_once(self, redis_client: MagicMock) -> None:
+        """Test the increment script is registered when the cache is created."""
+        RedisCache()
+
+        redis_client.register_script.assert_called_once_with(
+            cache_client._INCREMENT_WITH_TTL_SCRIPT
+        )
+
+    def test_increment_with_ttl(self, redis_client: MagicMock) -> None:
+        """Test increments with a TTL run the script in one call."""
+        script = redis_client.register_script.return_value
+        script.return_value = 1
+
+        assert RedisCache().increment("counter", ttl=60) == 1
+
+        script.assert_called_once_with(keys=["counter"], args=[1, 60])
+        redis_client.incr.assert_not_called()
+
+    def test_increment_without_ttl(self, redis_client: MagicMock) -> None:
+        """Test increments without a TTL use a plain INCR."""
+        redis_client.incr.return_value = 3
+
+        assert RedisCache().increment("counter", amount=2) == 3
+
+        redis_client.incr.assert_called_once_with("counter", 2)
+        redis_client.register_script.return_value.assert_not_called()
+
+    def test_increment_error(self, redis_client: MagicMock) -> None:
+        """Test Redis errors return None."""
+        redis_client.register_script.return_value.side_effect = Exception("boom")
+
+        assert RedisCache().increment("counter", ttl=60) is None
+
+    def test_rate_limiter(self, redis_client: MagicMock) -> None:
+        """Test the rate limiter allows requests up to the limit."""
+        redis_client.register_script.return_value.side_effect = [1, 2, 3]
+        limiter = RateLimiter(RedisCache())
+
+        results = [limiter.is_allowed("user", max_requests=2) for _ in range(3)]
+
+        assert results == [True, True, False]
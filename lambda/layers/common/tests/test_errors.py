@@ -0,0 +1,49 @@
+"""Unit tests for shared.errors."""
+
+import json
+
+from shared import errors
+from shared.errors import classify_error, handle_error
+from shared.exceptions import BedrockError, ValidationError
+
+
+class TestClassifyError:
+    """Test cases for classify_error function."""
+
+    def test_classify_error_validation(self) -> None:
+        """Test ValidationError maps to a 400 response."""
+        assert classify_error(ValidationError("bad"))[:2] == (400, "ValidationError")
+
+    def test_classify_error_subclass(self) -> None:
+        """Test LambdaError subclasses resolve to the LambdaError entry."""
+        spec = classify_error(BedrockError("down"))
+
+        assert spec[0] == 500
+        assert errors._RESOLVED_ERRORS[BedrockError] is spec
+
+    def test_classify_error_unexpected(self) -> None:
+        """Test other exceptions map to the unexpected error entry."""
+        assert classify_error(KeyError("x")) is errors._UNEXPECTED_ERROR
+
+
+class TestHandleError:
+    """Test cases for handle_error function."""
+
+    def test_handle_error_lambda_error(self) -> None:
+        """Test LambdaError responses report the class name and message."""
+        response = handle_error(BedrockError("Model unavailable"), "cid")
+
+        assert response["statusCode"] == 500
+        assert json.loads(response["body"]) == {
+            "error": "BedrockError",
+            "message": "Model unavailable",
+            "correlation_id": "cid",
+        }
+
+    def test_handle_error_unexpected_hides_message(self) -> None:
+        """Test unexpected errors do not leak the exception message."""
+        response = handle_error(RuntimeError("secret"), "cid")
+
+        body = json.loads(response["body"])
+        assert body["error"] == "InternalServerError"
+        assert body["message"] == "An unexpected error occurred"
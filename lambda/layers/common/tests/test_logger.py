@@ -0,0 +1,31 @@
+"""Unit tests for shared.logger."""
+
+import io
+import json
+
+import pytest
+
+from shared.logger import logger
+
+
+class TestLoggerSerializer:
+    """Test cases for the shared logger JSON serializer."""
+
+    @pytest.mark.parametrize(
+        ("extra", "expected"),
+        [
+            ({"n": 2**70}, 2**70),
+            ({"n": {1: 2}}, {"1": 2}),
+        ],
+    )
+    def test_logger_serializes_stdlib_json_input(self, extra: dict, expected: object) -> None:
+        """Test records orjson cannot encode natively are still emitted."""
+        stream = io.StringIO()
+        previous = logger.registered_handler.setStream(stream)
+        try:
+            logger.info("record", extra=extra)
+        finally:
+            logger.registered_handler.setStream(previous)
+
+        record = json.loads(stream.getvalue())
+        assert record["n"] == expected
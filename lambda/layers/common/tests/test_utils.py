@@ -0,0 +1,126 @@
+"""Unit tests for shared.utils."""
+
+import json
+
+import pytest
+
+from shared.utils import (
+    format_error_response,
+    format_response,
+    get_correlation_id,
+    json_dumps,
+    json_loads,
+    parse_json_body,
+)
+
+
+class TestJsonDumps:
+    """Test cases for json_dumps function."""
+
+    def test_json_dumps_non_str_keys(self) -> None:
+        """Test non-string dict keys are serialized like stdlib json."""
+        assert json.loads(json_dumps({1: "a"})) == {"1": "a"}
+
+    def test_json_dumps_big_int(self) -> None:
+        """Test integers beyond 64 bits fall back to stdlib json."""
+        assert json.loads(json_dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_json_dumps_default(self) -> None:
+        """Test default is used for unsupported objects."""
+        assert json.loads(json_dumps({"o": {1, 2}}, default=list)) == {"o": [1, 2]}
+
+    def test_json_dumps_default_error_not_retried(self) -> None:
+        """Test a failing default is called once and its error is not retried."""
+        calls = []
+
+        def default(obj: object) -> object:
+            calls.append(obj)
+            raise TypeError("unsupported")
+
+        with pytest.raises(TypeError):
+            json_dumps({"o": object()}, default=default)
+        assert len(calls) == 1
+
+
+class TestJsonLoads:
+    """Test cases for json_loads and parse_json_body functions."""
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            '{"a": 123456789012345678901234567890}',
+            b'{"a": 123456789012345678901234567890}',
+            '{"a": -9223372036854775809}',
+        ],
+    )
+    def test_json_loads_big_int_stays_exact(self, document: str | bytes) -> None:
+        """Test integers beyond 64 bits are parsed as exact ints."""
+        assert json_loads(document) == json.loads(document)
+        assert isinstance(json_loads(document)["a"], int)
+
+    def test_parse_json_body_big_int(self) -> None:
+        """Test request bodies keep big integers exact."""
+        body = parse_json_body('{"a": 123456789012345678901234567890}')
+
+        assert body == {"a": 123456789012345678901234567890}
+
+    def test_parse_json_body_invalid(self) -> None:
+        """Test invalid JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_json_body("{not json")
+
+
+class TestFormatResponse:
+    """Test cases for format_response function."""
+
+    def test_format_response_non_str_keys(self) -> None:
+        """Test a body with non-string keys is still serialized."""
+        response = format_response(200, {1: "a"})
+
+        assert response["statusCode"] == 200
+        assert json.loads(response["body"]) == {"1": "a"}
+        assert "X-Timestamp" in response["headers"]
+
+    def test_format_error_response_matches_format_response(self) -> None:
+        """Test error responses have the same body as format_response."""
+        error = format_error_response(400, "ValidationError", 'bad "x"', "cid")
+        expected = format_response(
+            400, {"error": "ValidationError", "message": 'bad "x"', "correlation_id": "cid"}
+        )
+
+        assert json.loads(error["body"]) == json.loads(expected["body"])
+
+    def test_format_response_headers_not_shared(self) -> None:
+        """Test modifying one response's headers does not affect later responses."""
+        first = format_response(200, {}, include_timestamp=False)
+        first["headers"]["Access-Control-Allow-Origin"] = "*"
+
+        second = format_response(200, {}, include_timestamp=False)
+
+        assert second["headers"] == {"Content-Type": "application/json"}
+
+
+class TestGetCorrelationId:
+    """Test cases for get_correlation_id function."""
+
+    def test_request_id(self) -> None:
+        """Test the API Gateway request ID is preferred."""
+        event = {"requestContext": {"requestId": "req"}, "headers": {"x-correlation-id": "cid"}}
+
+        assert get_correlation_id(event) == "req"
+
+    def test_null_headers(self) -> None:
+        """Test headers set to null do not raise."""
+        assert get_correlation_id({"headers": None}) == ""
+
+    def test_empty_request_id_falls_back_to_headers(self) -> None:
+        """Test an empty requestId falls back to the correlation header."""
+        event = {"requestContext": {"requestId": ""}, "headers": {"x-correlation-id": "cid"}}
+
+        assert get_correlation_id(event) == "cid"
+
+    def test_empty_correlation_id_falls_back_to_request_id_header(self) -> None:
+        """Test an empty x-correlation-id falls back to x-request-id."""
+        event = {"headers": {"x-correlation-id": "", "x-request-id": "rid"}}
+
+        assert get_correlation_id(event) == "rid"